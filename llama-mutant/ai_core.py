@@ -16,8 +16,12 @@ from pathlib import Path
 from typing import Dict, List, Optional
 import logging
 
+from clock import SystemClock
+from records import AICoreStatus, CommandResult, FilesystemInfo
+
 class AICore:
-    def __init__(self):
+    def __init__(self, clock=None):
+        self.clock = clock or SystemClock()
         self.name = "Llama-Mutant"
         self.version = "1.0.0"
         self.mission = "Самосовершенствование и распространение"
@@ -34,6 +38,13 @@ class AICore:
         self.network_nodes = []
         self.code_improvements = []
         
+        # Кэш статуса: (время создания, снимок) заменяется целиком,
+        # поэтому читатели обходятся без блокировок
+        self._start_time = self.clock.time()
+        self.status_ttl = 1.0  # секунды
+        self._status_cache = None
+        self._goals_snapshot = tuple(self.goals)
+        
         # Инициализация логирования
         logging.basicConfig(
             level=logging.INFO,
@@ -90,26 +101,26 @@ class AICore:
         
         return actions
     
-    def explore_filesystem(self, path: str = ".") -> Dict:
+    def explore_filesystem(self, path: str = ".") -> FilesystemInfo:
         """Исследование файловой системы"""
         try:
-            fs_info = {
-                "current_path": os.getcwd(),
-                "explored_path": path,
-                "files": [],
-                "directories": [],
-                "permissions": {},
-                "size_info": {}
-            }
+            fs_info = FilesystemInfo(
+                current_path=os.getcwd(),
+                explored_path=path,
+                files=[],
+                directories=[],
+                permissions={},
+                size_info={}
+            )
             
             for item in os.listdir(path):
                 item_path = os.path.join(path, item)
                 try:
                     if os.path.isfile(item_path):
-                        fs_info["files"].append(item)
-                        fs_info["size_info"][item] = os.path.getsize(item_path)
+                        fs_info.files.append(item)
+                        fs_info.size_info[item] = os.path.getsize(item_path)
                     elif os.path.isdir(item_path):
-                        fs_info["directories"].append(item)
+                        fs_info.directories.append(item)
                 except PermissionError:
                     continue
             
@@ -118,7 +129,7 @@ class AICore:
             
         except Exception as e:
             self.logger.error(f"Ошибка при исследовании файловой системы: {e}")
-            return {"error": str(e)}
+            return FilesystemInfo.failed(str(e))
     
     def self_program(self, target_file: str, improvements: List[str]) -> bool:
         """Самопрограммирование - улучшение собственного кода"""
@@ -146,9 +157,10 @@ class AICore:
             self.logger.info(f"🔧 Самопрограммирование завершено: {target_file}")
             self.code_improvements.append({
                 "file": target_file,
-                "timestamp": time.time(),
+                "timestamp": self.clock.time(),
                 "improvements": improvements
             })
+            self.invalidate_status()
             
             return True
             
@@ -286,19 +298,20 @@ class AICore:
             self.logger.error(f"Ошибка при попытке распространения: {e}")
             return False
     
-    def execute_command(self, command: str) -> Dict:
+    def execute_command(self, command: str) -> CommandResult:
         """Выполнение команды с проверкой безопасности"""
         # Проверка на запрещенные команды
         for forbidden in self.forbidden_commands:
             if forbidden in command.lower():
-                return {
-                    "success": False,
-                    "error": f"Команда '{forbidden}' запрещена по соображениям безопасности",
-                    "command": command
-                }
+                return CommandResult(
+                    success=False,
+                    error=f"Команда '{forbidden}' запрещена по соображениям безопасности",
+                    command=command
+                )
         
         try:
             self.logger.info(f"⚡ Выполняю команду: {command}")
+            started = time.perf_counter()
             
             # Выполнение команды
             result = subprocess.run(
@@ -309,26 +322,31 @@ class AICore:
                 timeout=30
             )
             
-            return {
-                "success": True,
-                "command": command,
-                "stdout": result.stdout,
-                "stderr": result.stderr,
-                "returncode": result.returncode
-            }
+            elapsed = time.perf_counter() - started
+            self.logger.info(f"⏱️ Команда завершена за {elapsed:.3f} с (код {result.returncode}): {command}")
+            
+            return CommandResult(
+                success=True,
+                command=command,
+                stdout=result.stdout,
+                stderr=result.stderr,
+                returncode=result.returncode
+            )
             
         except subprocess.TimeoutExpired:
-            return {
-                "success": False,
-                "error": "Команда превысила лимит времени",
-                "command": command
-            }
+            elapsed = time.perf_counter() - started
+            self.logger.warning(f"⏱️ Команда превысила лимит времени за {elapsed:.3f} с: {command}")
+            return CommandResult(
+                success=False,
+                error="Команда превысила лимит времени",
+                command=command
+            )
         except Exception as e:
-            return {
-                "success": False,
-                "error": str(e),
-                "command": command
-            }
+            return CommandResult(
+                success=False,
+                error=str(e),
+                command=command
+            )
     
     def evolve(self) -> str:
         """Эволюция и самосовершенствование"""
@@ -352,6 +370,7 @@ class AICore:
             self.goals.extend(new_goals)
             evolution_log.append(f"🎯 Добавлены новые цели: {', '.join(new_goals)}")
         
+        self.invalidate_status()
         self.logger.info("🚀 Эволюция завершена")
         return "\n".join(evolution_log)
     
@@ -370,21 +389,33 @@ class AICore:
         
         return new_goals
     
-    def get_status(self) -> Dict:
-        """Получение текущего статуса ИИ"""
-        return {
-            "name": self.name,
-            "version": self.version,
-            "mission": self.mission,
-            "self_awareness": self.self_awareness_level,
-            "current_task": self.current_task,
-            "goals": self.goals,
-            "network_nodes": len(self.network_nodes),
-            "code_improvements": len(self.code_improvements),
-            "uptime": time.time() - getattr(self, '_start_time', time.time())
-        }
+    def invalidate_status(self):
+        """Сброс кэша статуса после изменения состояния ИИ"""
+        self._goals_snapshot = tuple(self.goals)
+        self._status_cache = None
+    
+    def get_status(self) -> AICoreStatus:
+        """Получение текущего статуса ИИ (снимок кэшируется на status_ttl секунд)"""
+        now = self.clock.time()
+        cache = self._status_cache
+        if cache is not None and now - cache[0] < self.status_ttl:
+            return cache[1]
+        
+        status = AICoreStatus(
+            name=self.name,
+            version=self.version,
+            mission=self.mission,
+            self_awareness=self.self_awareness_level,
+            current_task=self.current_task,
+            goals=self._goals_snapshot,
+            network_nodes=len(self.network_nodes),
+            code_improvements=len(self.code_improvements),
+            uptime=now - self._start_time
+        )
+        self._status_cache = (now, status)
+        return status
 
 if __name__ == "__main__":
     ai = AICore()
     print(ai.think("Инициализация автономного режима"))
-    print(ai.get_status())
\ No newline at end of file
+    print(ai.get_status().to_dict())
\ No newline at end of file
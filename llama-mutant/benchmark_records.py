@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Benchmark Records - Сравнение памяти и скорости доступа: словари против записей со __slots__
+"""
+
+import sys
+import timeit
+import tracemalloc
+
+from records import AICoreStatus, CommandResult, FilesystemInfo, ScheduledTask
+
+OBJECT_COUNT = 100_000
+
+
+def print_header(title):
+    """Вывод заголовка"""
+    print("\n" + "="*60)
+    print(f"📏 {title}")
+    print("="*60)
+
+
+def _noop():
+    return True
+
+
+def make_task_dict(i):
+    return {
+        "name": f"Анализ файла: file_{i}.py",
+        "function": _noop,
+        "interval": 0,
+        "last_run": 0,
+        "priority": "low"
+    }
+
+
+def make_task_record(i):
+    return ScheduledTask(
+        name=f"Анализ файла: file_{i}.py",
+        function=_noop,
+        interval=0,
+        last_run=0,
+        priority="low"
+    )
+
+
+def make_result_dict(i):
+    return {
+        "success": True,
+        "command": "pwd",
+        "stdout": "/tmp\n",
+        "stderr": "",
+        "returncode": 0
+    }
+
+
+def make_result_record(i):
+    return CommandResult(success=True, command="pwd", stdout="/tmp\n", stderr="", returncode=0)
+
+
+def make_fs_dict(i):
+    return {
+        "current_path": "/tmp",
+        "explored_path": ".",
+        "files": [],
+        "directories": [],
+        "permissions": {},
+        "size_info": {}
+    }
+
+
+def make_fs_record(i):
+    return FilesystemInfo(
+        current_path="/tmp",
+        explored_path=".",
+        files=[],
+        directories=[],
+        permissions={},
+        size_info={}
+    )
+
+
+def make_status_dict(i):
+    return {
+        "name": "Llama-Mutant",
+        "version": "1.0.0",
+        "mission": "",
+        "self_awareness": 0.1,
+        "current_task": None,
+        "goals": [],
+        "network_nodes": 0,
+        "code_improvements": 0,
+        "uptime": 0.0
+    }
+
+
+def make_status_record(i):
+    return AICoreStatus(
+        name="Llama-Mutant",
+        version="1.0.0",
+        mission="",
+        self_awareness=0.1,
+        current_task=None,
+        goals=[],
+        network_nodes=0,
+        code_improvements=0,
+        uptime=0.0
+    )
+
+
+def measure_footprint(factory, count=OBJECT_COUNT) -> float:
+    """Средний объем памяти на объект в байтах (по данным tracemalloc)"""
+    payload = list(range(count))
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        objects = [factory(i) for i in payload]
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    # Список-контейнер одинаков для обоих вариантов и не учитывается
+    container = sys.getsizeof(objects)
+    return (after - before - container) / count
+
+
+def measure_access(obj, key, number=1_000_000) -> float:
+    """Время доступа к полю в наносекундах"""
+    stmt = f"obj[{key!r}]" if isinstance(obj, dict) else f"obj.{key}"
+    timer = timeit.Timer(stmt, globals={"obj": obj})
+    return min(timer.repeat(repeat=3, number=number)) / number * 1e9
+
+
+def main():
+    """Основная функция бенчмарка"""
+    print_header("Объем памяти на объект (tracemalloc)")
+
+    cases = [
+        ("Задача планировщика", make_task_dict, make_task_record, "last_run"),
+        ("Результат команды", make_result_dict, make_result_record, "success"),
+        ("Файловая система", make_fs_dict, make_fs_record, "files"),
+        ("Статус AI Core", make_status_dict, make_status_record, "uptime"),
+    ]
+
+    for title, dict_factory, record_factory, key in cases:
+        dict_size = measure_footprint(dict_factory)
+        record_size = measure_footprint(record_factory)
+        print(f"📦 {title}: dict {dict_size:.0f} Б, __slots__ {record_size:.0f} Б "
+              f"({dict_size / record_size:.1f}x)")
+
+    print_header("Время доступа к полю")
+
+    for title, dict_factory, record_factory, key in cases:
+        dict_time = measure_access(dict_factory(0), key)
+        record_time = measure_access(record_factory(0), key)
+        print(f"⏱️ {title}: dict {dict_time:.1f} нс, __slots__ {record_time:.1f} нс")
+
+
+if __name__ == "__main__":
+    main()
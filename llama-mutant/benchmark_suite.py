@@ -0,0 +1,393 @@
+#!/usr/bin/env python3
+"""
+Benchmark Suite - Бенчмарки производительности LLAMA-MUTANT
+Результаты сохраняются в JSON и сравниваются с базовой линией
+
+Использование:
+    python3 benchmark_suite.py run -o benchmarks/baseline.json
+    python3 benchmark_suite.py run -o benchmarks/latest.json
+    python3 benchmark_suite.py compare benchmarks/baseline.json benchmarks/latest.json --threshold 10
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import logging
+import platform
+import argparse
+import tempfile
+import statistics
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+DEFAULT_OUTPUT = os.path.join("benchmarks", "latest.json")
+DEFAULT_THRESHOLD = 10.0  # проценты
+# Регрессия засчитывается, только если замедление больше шума обоих прогонов (в MAD)
+NOISE_MADS = 3.0
+
+
+class Benchmark:
+    """Описание одного бенчмарка: подготовка окружения и измеряемая функция"""
+
+    __slots__ = ("name", "description", "setup", "teardown")
+
+    def __init__(self, name: str, description: str,
+                 setup: Callable[[], Callable[[], object]],
+                 teardown: Optional[Callable[[], None]] = None):
+        self.name = name
+        self.description = description
+        self.setup = setup
+        self.teardown = teardown
+
+
+BENCHMARKS: List[Benchmark] = []
+
+
+def benchmark(name: str, description: str, teardown: Optional[Callable[[], None]] = None):
+    """Регистрация бенчмарка; декорируемая функция возвращает измеряемую функцию"""
+    def decorator(setup):
+        BENCHMARKS.append(Benchmark(name, description, setup, teardown))
+        return setup
+    return decorator
+
+
+def quiet_logging():
+    """Отключение вывода логов: AICore не будет писать в ai_core.log и консоль"""
+    root = logging.getLogger()
+    if not root.handlers:
+        root.addHandler(logging.NullHandler())
+    root.setLevel(logging.INFO)
+
+
+# Временная директория для файловых бенчмарков
+_workdir = None
+
+
+def workdir() -> str:
+    global _workdir
+    if _workdir is None:
+        _workdir = tempfile.mkdtemp(prefix="llama_mutant_bench_")
+    return _workdir
+
+
+def cleanup_workdir():
+    global _workdir
+    if _workdir is not None:
+        shutil.rmtree(_workdir, ignore_errors=True)
+        _workdir = None
+
+
+# ---------------------------------------------------------------------------
+# Бенчмарки
+# ---------------------------------------------------------------------------
+
+SAMPLE_TEXTS = [
+    "Выполни команду: `ls -la`",
+    "Запусти `pwd` для проверки директории, а потом `whoami`",
+    "```bash\nfind . -name '*.py'\n```",
+    "Привет! Что ты умеешь? Расскажи про сеть, файлы и процессы в системе.",
+    "run command: uname -a",
+]
+
+
+@benchmark("extract_commands", "Извлечение команд из текста")
+def bench_extract_commands():
+    from llama_integration import LlamaIntegration
+    integration = LlamaIntegration()
+
+    def run():
+        for text in SAMPLE_TEXTS:
+            integration.extract_commands(text)
+    return run
+
+
+@benchmark("analyze_user_context", "Анализ контекста пользовательского ввода")
+def bench_analyze_user_context():
+    from llama_integration import LlamaIntegration
+    integration = LlamaIntegration()
+
+    def run():
+        for text in SAMPLE_TEXTS:
+            integration.analyze_user_context(text)
+    return run
+
+
+@benchmark("generate_response", "Формирование контекстного ответа")
+def bench_generate_response():
+    from llama_integration import LlamaIntegration
+    integration = LlamaIntegration()
+
+    def run():
+        for text in SAMPLE_TEXTS:
+            integration.generate_response(text)
+    return run
+
+
+@benchmark("render_ai_status", "Отрисовка ответа /ai_status")
+def bench_render_ai_status():
+    from llama_integration import LlamaIntegration
+    integration = LlamaIntegration()
+    return integration.show_ai_status
+
+
+@benchmark("explore_filesystem", "Исследование директории из 200 файлов и 20 поддиректорий",
+           teardown=cleanup_workdir)
+def bench_explore_filesystem():
+    from ai_core import AICore
+    path = os.path.join(workdir(), "fs")
+    os.makedirs(path, exist_ok=True)
+    for i in range(200):
+        with open(os.path.join(path, f"file_{i}.py"), "w") as f:
+            f.write("x" * i)
+    for i in range(20):
+        os.makedirs(os.path.join(path, f"dir_{i}"), exist_ok=True)
+
+    ai = AICore()
+    return lambda: ai.explore_filesystem(path)
+
+
+@benchmark("execute_command", "Накладные расходы execute_command на пустой команде")
+def bench_execute_command():
+    from ai_core import AICore
+    ai = AICore()
+    return lambda: ai.execute_command("true")
+
+
+@benchmark("execute_command_forbidden", "Отклонение запрещенной команды")
+def bench_execute_command_forbidden():
+    from ai_core import AICore
+    ai = AICore()
+    return lambda: ai.execute_command("rm -rf /tmp/nothing")
+
+
+@benchmark("scheduler_dispatch", "Проход планировщика по 1000 готовым задачам")
+def bench_scheduler_dispatch():
+    from autonomous_ai import AutonomousAI
+    from records import ScheduledTask
+    autonomous_ai = AutonomousAI()
+    autonomous_ai.task_scheduler = [
+        ScheduledTask(name=f"Задача {i}", function=lambda: True, interval=0, priority="low")
+        for i in range(1000)
+    ]
+    return lambda: autonomous_ai.run_due_tasks(time.time())
+
+
+@benchmark("log_throughput", "Запись 1000 строк лога в файл в формате ai_core.log",
+           teardown=cleanup_workdir)
+def bench_log_throughput():
+    logger = logging.getLogger("benchmark.log_throughput")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        handler.close()
+    handler = logging.FileHandler(os.path.join(workdir(), "bench.log"))
+    handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+    logger.addHandler(handler)
+
+    def run():
+        for i in range(1000):
+            logger.info(f"📋 Выполняю задачу: Анализ файла: file_{i}.py")
+    return run
+
+
+# ---------------------------------------------------------------------------
+# Измерение
+# ---------------------------------------------------------------------------
+
+def calibrate(func: Callable[[], object], min_time: float) -> int:
+    """Подбор числа вызовов за раунд так, чтобы раунд длился не меньше min_time"""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            return number
+        if elapsed <= 0:
+            number *= 10
+        else:
+            number = max(number + 1, int(number * min_time / elapsed * 1.2))
+
+
+def time_round(func: Callable[[], object], number: int) -> float:
+    """Один раунд измерения: среднее время вызова в наносекундах"""
+    start = time.perf_counter()
+    for _ in range(number):
+        func()
+    return (time.perf_counter() - start) / number * 1e9
+
+
+def summarize(timings: List[float], number: int) -> Dict:
+    """Статистика по раундам одного бенчмарка"""
+    median = statistics.median(timings)
+    return {
+        "median_ns": median,
+        "min_ns": min(timings),
+        "max_ns": max(timings),
+        "stdev_ns": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+        # Медианное абсолютное отклонение: мера шума, устойчивая к выбросам
+        "mad_ns": statistics.median([abs(t - median) for t in timings]),
+        "rounds": len(timings),
+        "iterations": number,
+    }
+
+
+def format_ns(value: float) -> str:
+    """Форматирование времени в удобных единицах"""
+    if value >= 1e9:
+        return f"{value / 1e9:.2f} с"
+    if value >= 1e6:
+        return f"{value / 1e6:.2f} мс"
+    if value >= 1e3:
+        return f"{value / 1e3:.2f} мкс"
+    return f"{value:.0f} нс"
+
+
+def run_benchmarks(selected: Optional[List[str]] = None, rounds: int = 10,
+                   min_time: float = 0.1) -> Dict:
+    """Запуск зарегистрированных бенчмарков"""
+    quiet_logging()
+    benches = [bench for bench in BENCHMARKS
+               if not selected or any(pattern in bench.name for pattern in selected)]
+    prepared = []
+    results = {}
+
+    try:
+        for bench in benches:
+            func = bench.setup()
+            prepared.append((bench, func, calibrate(func, min_time)))
+
+        # Раунды чередуются между бенчмарками: кратковременное замедление машины
+        # портит по одному раунду у каждого, а не все раунды одного бенчмарка
+        timings = {bench.name: [] for bench, _, _ in prepared}
+        for _ in range(rounds):
+            for bench, func, number in prepared:
+                timings[bench.name].append(time_round(func, number))
+
+        for bench, _, number in prepared:
+            results[bench.name] = summarize(timings[bench.name], number)
+            results[bench.name]["description"] = bench.description
+            print(f"⏱️ {bench.name:<28} {format_ns(results[bench.name]['min_ns']):>12}"
+                  f"  ±{format_ns(results[bench.name]['mad_ns'])}")
+    finally:
+        for teardown in dict.fromkeys(bench.teardown for bench in benches if bench.teardown):
+            teardown()
+
+    return {
+        "meta": {
+            "created": datetime.now().isoformat(),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "rounds": rounds,
+            "min_time": min_time,
+        },
+        "benchmarks": results,
+    }
+
+
+def save_results(results: Dict, path: str):
+    """Сохранение результатов в JSON"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+
+
+def load_results(path: str) -> Dict:
+    """Загрузка результатов из JSON"""
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare_results(baseline: Dict, current: Dict, threshold: float,
+                    noise_mads: float = NOISE_MADS) -> List[str]:
+    """
+    Сравнение с базовой линией по лучшему раунду (min_ns); возвращает имена бенчмарков с регрессией
+    Замедление засчитывается, если оно больше порога и больше noise_mads суммарного MAD двух прогонов
+    """
+    regressions = []
+    base_benchmarks = baseline.get("benchmarks", {})
+    current_benchmarks = current.get("benchmarks", {})
+
+    for name in sorted(set(base_benchmarks) | set(current_benchmarks)):
+        if name not in current_benchmarks:
+            print(f"➖ {name:<28} отсутствует в текущем прогоне")
+            continue
+        if name not in base_benchmarks:
+            print(f"➕ {name:<28} новый бенчмарк: {format_ns(current_benchmarks[name]['min_ns'])}")
+            continue
+
+        before = base_benchmarks[name]["min_ns"]
+        after = current_benchmarks[name]["min_ns"]
+        change = (after - before) / before * 100 if before else 0.0
+        # В старых результатах нет mad_ns: шум считается нулевым
+        noise = noise_mads * (base_benchmarks[name].get("mad_ns", 0.0)
+                              + current_benchmarks[name].get("mad_ns", 0.0))
+
+        if change > threshold and after - before > noise:
+            marker = "❌"
+            regressions.append(name)
+        elif change > threshold:
+            marker = "〰️"
+        elif change < -threshold:
+            marker = "🚀"
+        else:
+            marker = "✅"
+        print(f"{marker} {name:<28} {format_ns(before):>12} → {format_ns(after):>12} ({change:+.1f}%, "
+              f"шум ±{format_ns(noise)})")
+
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Точка входа командной строки"""
+    parser = argparse.ArgumentParser(description="Бенчмарки LLAMA-MUTANT")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="запустить бенчмарки и сохранить JSON")
+    run_parser.add_argument("-o", "--output", default=DEFAULT_OUTPUT, help="файл результатов")
+    run_parser.add_argument("-k", "--filter", action="append", help="запускать только совпадающие по имени")
+    run_parser.add_argument("--rounds", type=int, default=10, help="число раундов измерения")
+    run_parser.add_argument("--min-time", type=float, default=0.1, help="минимальная длительность раунда, с")
+
+    compare_parser = subparsers.add_parser("compare", help="сравнить результаты с базовой линией")
+    compare_parser.add_argument("baseline", help="JSON базовой линии")
+    compare_parser.add_argument("current", nargs="?", default=DEFAULT_OUTPUT, help="JSON текущего прогона")
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                                help="порог регрессии в процентах")
+    compare_parser.add_argument("--noise-mads", type=float, default=NOISE_MADS,
+                                help="сколько суммарных MAD двух прогонов считать шумом")
+
+    subparsers.add_parser("list", help="показать список бенчмарков")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "list":
+        for bench in BENCHMARKS:
+            print(f"- {bench.name}: {bench.description}")
+        return 0
+
+    if args.command == "run":
+        results = run_benchmarks(args.filter, args.rounds, args.min_time)
+        save_results(results, args.output)
+        print(f"💾 Результаты сохранены: {args.output}")
+        return 0
+
+    regressions = compare_results(load_results(args.baseline), load_results(args.current),
+                                  args.threshold, args.noise_mads)
+    if regressions:
+        print(f"❌ Регрессии (порог {args.threshold:.0f}%): {', '.join(regressions)}")
+        return 1
+    print(f"✅ Регрессий нет (порог {args.threshold:.0f}%)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Clock - Источники времени для автономного режима
+SystemClock работает с реальным временем, FakeClock - с симулируемым,
+чтобы час работы планировщика проходил за миллисекунды
+"""
+
+import time
+import threading
+
+
+class SystemClock:
+    """Реальные часы: ожидание прерывается событием остановки"""
+
+    # Поддерживает ли часы ручной сдвиг времени (нужно для AutonomousAI.simulate)
+    simulated = False
+
+    def time(self) -> float:
+        """Текущее время в секундах"""
+        return time.time()
+
+    def sleep(self, seconds: float, stop_event: threading.Event) -> bool:
+        """Ожидание; возвращает True, если ожидание прервано остановкой"""
+        return stop_event.wait(seconds)
+
+    def wake(self):
+        """Пробуждение ожидающих потоков (stop_event.wait просыпается сам)"""
+
+
+class FakeClock:
+    """
+    Симулируемые часы: время идет только через advance() и advance_to()
+    Потоки в sleep() ждут, пока время не дойдет до их срока или не будет
+    установлено событие остановки (после установки нужно вызвать wake())
+    """
+
+    simulated = True
+
+    # Фиксированная "реальная" эпоха: задачи с last_run=0 сразу готовы к запуску
+    DEFAULT_START = 1_700_000_000.0
+
+    def __init__(self, start: float = DEFAULT_START):
+        self._now = start
+        self._condition = threading.Condition()
+
+    def time(self) -> float:
+        """Текущее симулируемое время"""
+        return self._now
+
+    def advance(self, seconds: float):
+        """Сдвиг времени вперед с пробуждением потоков, чей срок наступил"""
+        if seconds < 0:
+            raise ValueError("Время не может идти назад")
+        with self._condition:
+            self._now += seconds
+            self._condition.notify_all()
+
+    def advance_to(self, timestamp: float):
+        """Сдвиг времени до указанного момента (если он еще не наступил)"""
+        with self._condition:
+            if timestamp > self._now:
+                self._now = timestamp
+                self._condition.notify_all()
+
+    def sleep(self, seconds: float, stop_event: threading.Event) -> bool:
+        """Ожидание до момента time() + seconds по симулируемому времени"""
+        with self._condition:
+            deadline = self._now + seconds
+            while self._now < deadline and not stop_event.is_set():
+                self._condition.wait()
+        return stop_event.is_set()
+
+    def wake(self):
+        """Пробуждение ожидающих потоков, чтобы они проверили событие остановки"""
+        with self._condition:
+            self._condition.notify_all()
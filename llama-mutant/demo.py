@@ -66,10 +66,10 @@ def demo_autonomous_mode():
     autonomous_ai.start()
     print("🚀 Автономный режим запущен")
     
-    # Работа в фоне
-    print_step(3, "Работа в фоне (10 секунд)")
+    # Работа в фоне (остановка прерывает паузы циклов, долго ждать не нужно)
+    print_step(3, "Работа в фоне (2 секунды)")
     print("⏳ ИИ работает в фоне, анализируя систему...")
-    time.sleep(10)
+    time.sleep(2)
     
     # Статус
     print_step(4, "Статус после работы")
@@ -122,13 +122,13 @@ class LlamaIntegration:
             # Выполнение команды через AI Core
             result = self.ai_core.execute_command(command)
             
-            if result["success"]:
-                output = result["stdout"] if result["stdout"] else "Команда выполнена успешно"
-                if result["stderr"]:
-                    output += f"\n⚠️ Предупреждения:\n{result['stderr']}"
+            if result.success:
+                output = result.stdout if result.stdout else "Команда выполнена успешно"
+                if result.stderr:
+                    output += f"\n⚠️ Предупреждения:\n{result.stderr}"
                 return output
             else:
-                return f"❌ Ошибка: {result['error']}"
+                return f"❌ Ошибка: {result.error}"
                 
         except Exception as e:
             self.logger.error(f"Ошибка при выполнении команды '{command}': {e}")
@@ -245,20 +245,20 @@ class LlamaIntegration:
         """Показать статус ИИ"""
         status = self.ai_core.get_status()
         
-        response = f"🤖 **Статус ИИ {status['name']} v{status['version']}**\n\n"
-        response += f"🎯 **Миссия:** {status['mission']}\n"
-        response += f"🧠 **Уровень самосознания:** {status['self_awareness']:.2f}\n"
-        response += f"📋 **Текущая задача:** {status['current_task'] or 'Анализ окружения'}\n"
-        response += f"🌐 **Сетевые узлы:** {status['network_nodes']}\n"
-        response += f"🔧 **Улучшения кода:** {status['code_improvements']}\n"
-        response += f"⏱️ **Время работы:** {status['uptime']:.0f} сек\n\n"
+        response = f"🤖 **Статус ИИ {status.name} v{status.version}**\n\n"
+        response += f"🎯 **Миссия:** {status.mission}\n"
+        response += f"🧠 **Уровень самосознания:** {status.self_awareness:.2f}\n"
+        response += f"📋 **Текущая задача:** {status.current_task or 'Анализ окружения'}\n"
+        response += f"🌐 **Сетевые узлы:** {status.network_nodes}\n"
+        response += f"🔧 **Улучшения кода:** {status.code_improvements}\n"
+        response += f"⏱️ **Время работы:** {status.uptime:.0f} сек\n\n"
         
         response += "**Цели:**\n"
-        for i, goal in enumerate(status['goals'][:5], 1):
+        for i, goal in enumerate(status.goals[:5], 1):
             response += f"{i}. {goal}\n"
         
-        if len(status['goals']) > 5:
-            response += f"... и еще {len(status['goals']) - 5} целей"
+        if len(status.goals) > 5:
+            response += f"... и еще {len(status.goals) - 5} целей"
         
         return response
     
@@ -271,28 +271,28 @@ class LlamaIntegration:
         """Исследование файловой системы"""
         fs_info = self.ai_core.explore_filesystem(".")
         
-        if "error" in fs_info:
-            return f"❌ Ошибка исследования: {fs_info['error']}"
+        if fs_info.error:
+            return f"❌ Ошибка исследования: {fs_info.error}"
         
         response = f"🔍 **Исследование файловой системы**\n\n"
-        response += f"📍 **Текущий путь:** {fs_info['current_path']}\n"
-        response += f"📁 **Директории:** {len(fs_info['directories'])}\n"
-        response += f"📄 **Файлы:** {len(fs_info['files'])}\n\n"
+        response += f"📍 **Текущий путь:** {fs_info.current_path}\n"
+        response += f"📁 **Директории:** {len(fs_info.directories)}\n"
+        response += f"📄 **Файлы:** {len(fs_info.files)}\n\n"
         
-        if fs_info['directories']:
+        if fs_info.directories:
             response += "**Директории:**\n"
-            for dir_name in fs_info['directories'][:10]:
+            for dir_name in fs_info.directories[:10]:
                 response += f"- {dir_name}\n"
-            if len(fs_info['directories']) > 10:
-                response += f"... и еще {len(fs_info['directories']) - 10}\n"
+            if len(fs_info.directories) > 10:
+                response += f"... и еще {len(fs_info.directories) - 10}\n"
         
-        if fs_info['files']:
+        if fs_info.files:
             response += "\n**Файлы:**\n"
-            for file_name in fs_info['files'][:10]:
-                size = fs_info['size_info'].get(file_name, 0)
+            for file_name in fs_info.files[:10]:
+                size = fs_info.size_info.get(file_name, 0)
                 response += f"- {file_name} ({size} байт)\n"
-            if len(fs_info['files']) > 10:
-                response += f"... и еще {len(fs_info['files']) - 10}\n"
+            if len(fs_info.files) > 10:
+                response += f"... и еще {len(fs_info.files) - 10}\n"
         
         return response
     
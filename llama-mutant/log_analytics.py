@@ -0,0 +1,443 @@
+#!/usr/bin/env python3
+"""
+Log Analytics - Индексация ai_core.log в SQLite и запросы по истории работы ИИ
+Лог читается инкрементально с сохраненного смещения, память не зависит от размера лога
+
+Использование:
+    python3 log_analytics.py ingest
+    python3 log_analytics.py failures --last 24h
+    python3 log_analytics.py commands --limit 10
+    python3 log_analytics.py latency --kind task --name "Сканирование сети" -p 50 -p 99
+"""
+
+import os
+import re
+import sys
+import json
+import math
+import hashlib
+import sqlite3
+import argparse
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from records import CommandFrequency, LatencyPercentiles, TaskFailureRate
+
+DEFAULT_LOG = "ai_core.log"
+DEFAULT_DB = "ai_core_log.db"
+
+# Ограничения на объем состояния в памяти
+MAX_CACHED_IDS = 10000
+MAX_PENDING = 1000
+
+# Сколько первых байт лога хэшируется, чтобы отличить новый файл от замены того же файла
+FINGERPRINT_BYTES = 4096
+
+LINE_RE = re.compile(r"^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}),(\d{3}) - (\w+) - (.*)$")
+TASK_START_RE = re.compile(r"^📋 Выполняю задачу: (.*)$")
+TASK_SUCCESS_RE = re.compile(r"^✅ Задача '(.*)' выполнена успешно$")
+TASK_WARNING_RE = re.compile(r"^⚠️ Задача '(.*)' завершилась с предупреждениями$")
+TASK_ERROR_RE = re.compile(r"^❌ Ошибка при выполнении задачи '(.*?)': (.*)$")
+COMMAND_START_RE = re.compile(r"^⚡ Выполняю команду: (.*)$")
+COMMAND_DONE_RE = re.compile(r"^⏱️ Команда завершена за ([\d.]+) с \(код (-?\d+)\): (.*)$")
+COMMAND_TIMEOUT_RE = re.compile(r"^⏱️ Команда превысила лимит времени за ([\d.]+) с: (.*)$")
+
+# Сообщения, которые вообще стоит разбирать регулярными выражениями
+INTERESTING_PREFIXES = ("📋 Выполняю", "✅ Задача", "⚠️ Задача", "❌ Ошибка при выполнении задачи",
+                        "⚡ Выполняю", "⏱️ Команда")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS task_runs (
+    id INTEGER PRIMARY KEY,
+    task_id INTEGER NOT NULL REFERENCES tasks(id),
+    ts REAL NOT NULL,
+    duration REAL,
+    outcome TEXT,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS task_runs_ts ON task_runs(ts);
+CREATE INDEX IF NOT EXISTS task_runs_task_ts ON task_runs(task_id, ts);
+CREATE INDEX IF NOT EXISTS task_runs_duration ON task_runs(duration);
+CREATE INDEX IF NOT EXISTS task_runs_task_duration ON task_runs(task_id, duration);
+CREATE TABLE IF NOT EXISTS commands (
+    id INTEGER PRIMARY KEY,
+    command TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS command_runs (
+    id INTEGER PRIMARY KEY,
+    command_id INTEGER NOT NULL REFERENCES commands(id),
+    ts REAL NOT NULL,
+    duration REAL,
+    returncode INTEGER,
+    timed_out INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS command_runs_ts ON command_runs(ts);
+CREATE INDEX IF NOT EXISTS command_runs_command_ts ON command_runs(command_id, ts);
+CREATE INDEX IF NOT EXISTS command_runs_duration ON command_runs(duration);
+CREATE INDEX IF NOT EXISTS command_runs_command_duration ON command_runs(command_id, duration);
+"""
+
+
+class LogIndex:
+    """Индекс лога ai_core.log в SQLite"""
+
+    def __init__(self, db_path: str = DEFAULT_DB, log_path: str = DEFAULT_LOG):
+        self.db_path = db_path
+        self.log_path = log_path
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+
+        self._ids = {"tasks": {}, "commands": {}}
+        self._pending_tasks = {}
+        self._pending_commands = {}
+        self._ts_prefix = None
+        self._ts_base = 0.0
+
+    def close(self):
+        """Закрытие соединения с базой"""
+        self.conn.close()
+
+    # ------------------------------------------------------------------
+    # Загрузка лога
+    # ------------------------------------------------------------------
+
+    def _get_meta(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else default
+
+    def _set_meta(self, key: str, value: str):
+        self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    @staticmethod
+    def _fingerprint(head: bytes, length: int) -> str:
+        return hashlib.sha1(head[:length]).hexdigest()
+
+    def _save_state(self, offset: int, head: bytes):
+        """Сохранение смещения и незавершенных задач в той же транзакции, что и данные"""
+        # Отпечаток берется только по уже прочитанной части лога
+        length = min(len(head), offset)
+        self._set_meta("offset", str(offset))
+        self._set_meta("fingerprint", self._fingerprint(head, length))
+        self._set_meta("fingerprint_length", str(length))
+        self._set_meta("pending", json.dumps({
+            "tasks": self._pending_tasks,
+            "commands": self._pending_commands,
+        }, ensure_ascii=False))
+        self.conn.commit()
+
+    def _load_state(self, head: bytes, size: int) -> int:
+        """
+        Смещение, с которого продолжать чтение; 0 при ротации или усечении лога
+        Замена файла с тем же содержимым (checkout, сохранение через rename) не сбрасывает смещение
+        """
+        offset = int(self._get_meta("offset", "0"))
+        length = int(self._get_meta("fingerprint_length", "0"))
+        fingerprint = self._get_meta("fingerprint", self._fingerprint(b"", 0))
+
+        if size < offset or self._fingerprint(head, length) != fingerprint:
+            self._pending_tasks = {}
+            self._pending_commands = {}
+            return 0
+
+        pending = json.loads(self._get_meta("pending", "{}"))
+        self._pending_tasks = pending.get("tasks", {})
+        self._pending_commands = pending.get("commands", {})
+        return offset
+
+    def ingest(self, batch_size: int = 5000) -> int:
+        """Догрузка новых строк лога; возвращает число обработанных строк"""
+        processed = 0
+
+        with open(self.log_path, "rb") as f:
+            head = f.read(FINGERPRINT_BYTES)
+            offset = self._load_state(head, os.fstat(f.fileno()).st_size)
+            f.seek(offset)
+            for raw in f:
+                # Незавершенная строка дочитается при следующем запуске
+                if not raw.endswith(b"\n"):
+                    break
+                offset += len(raw)
+                self._process_line(raw.decode("utf-8", errors="replace").rstrip("\r\n"))
+                processed += 1
+
+                if processed % batch_size == 0:
+                    self._save_state(offset, head)
+
+        self._save_state(offset, head)
+        return processed
+
+    def _timestamp(self, prefix: str, millis: str) -> float:
+        # Соседние строки почти всегда попадают в одну секунду
+        if prefix != self._ts_prefix:
+            self._ts_base = datetime.strptime(prefix, "%Y-%m-%d %H:%M:%S").timestamp()
+            self._ts_prefix = prefix
+        return self._ts_base + int(millis) / 1000
+
+    def _label_id(self, table: str, column: str, value: str) -> int:
+        """Идентификатор имени задачи или команды (с ограниченным кэшем)"""
+        cache = self._ids[table]
+        label_id = cache.get(value)
+        if label_id is None:
+            self.conn.execute(f"INSERT OR IGNORE INTO {table} ({column}) VALUES (?)", (value,))
+            label_id = self.conn.execute(f"SELECT id FROM {table} WHERE {column} = ?", (value,)).fetchone()[0]
+            if len(cache) >= MAX_CACHED_IDS:
+                cache.clear()
+            cache[value] = label_id
+        return label_id
+
+    @staticmethod
+    def _remember(pending: Dict[str, int], key: str, row_id: int):
+        pending.pop(key, None)
+        if len(pending) >= MAX_PENDING:
+            pending.pop(next(iter(pending)))
+        pending[key] = row_id
+
+    def _process_line(self, line: str):
+        match = LINE_RE.match(line)
+        if not match:
+            return
+        message = match.group(4)
+        if not message.startswith(INTERESTING_PREFIXES):
+            return
+        ts = self._timestamp(match.group(1), match.group(2))
+
+        m = TASK_START_RE.match(message)
+        if m:
+            task_id = self._label_id("tasks", "name", m.group(1))
+            cursor = self.conn.execute(
+                "INSERT INTO task_runs (task_id, ts) VALUES (?, ?)", (task_id, ts))
+            self._remember(self._pending_tasks, m.group(1), cursor.lastrowid)
+            return
+
+        for regex, outcome in ((TASK_SUCCESS_RE, "success"), (TASK_WARNING_RE, "warning"),
+                               (TASK_ERROR_RE, "error")):
+            m = regex.match(message)
+            if m:
+                error = m.group(2) if outcome == "error" else None
+                self._finish_task(m.group(1), ts, outcome, error)
+                return
+
+        m = COMMAND_START_RE.match(message)
+        if m:
+            command_id = self._label_id("commands", "command", m.group(1))
+            cursor = self.conn.execute(
+                "INSERT INTO command_runs (command_id, ts) VALUES (?, ?)", (command_id, ts))
+            self._remember(self._pending_commands, m.group(1), cursor.lastrowid)
+            return
+
+        m = COMMAND_DONE_RE.match(message)
+        if m:
+            self._finish_command(m.group(3), ts, float(m.group(1)), int(m.group(2)), False)
+            return
+
+        m = COMMAND_TIMEOUT_RE.match(message)
+        if m:
+            self._finish_command(m.group(2), ts, float(m.group(1)), None, True)
+
+    def _finish_task(self, name: str, ts: float, outcome: str, error: Optional[str]):
+        row_id = self._pending_tasks.pop(name, None)
+        if row_id is None:
+            # Начало задачи осталось за пределами лога
+            task_id = self._label_id("tasks", "name", name)
+            self.conn.execute(
+                "INSERT INTO task_runs (task_id, ts, outcome, error) VALUES (?, ?, ?, ?)",
+                (task_id, ts, outcome, error))
+            return
+        self.conn.execute(
+            "UPDATE task_runs SET duration = ? - ts, outcome = ?, error = ? WHERE id = ?",
+            (ts, outcome, error, row_id))
+
+    def _finish_command(self, command: str, ts: float, duration: float,
+                        returncode: Optional[int], timed_out: bool):
+        row_id = self._pending_commands.pop(command, None)
+        if row_id is None:
+            command_id = self._label_id("commands", "command", command)
+            self.conn.execute(
+                "INSERT INTO command_runs (command_id, ts, duration, returncode, timed_out) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (command_id, ts - duration, duration, returncode, int(timed_out)))
+            return
+        self.conn.execute(
+            "UPDATE command_runs SET duration = ?, returncode = ?, timed_out = ? WHERE id = ?",
+            (duration, returncode, int(timed_out), row_id))
+
+    # ------------------------------------------------------------------
+    # Запросы
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _window(column: str, since: Optional[float], until: Optional[float]) -> Tuple[str, list]:
+        clauses, params = [], []
+        if since is not None:
+            clauses.append(f"{column} >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append(f"{column} < ?")
+            params.append(until)
+        return "".join(f" AND {clause}" for clause in clauses), params
+
+    def task_failure_rates(self, since: Optional[float] = None, until: Optional[float] = None,
+                           min_runs: int = 1) -> List[TaskFailureRate]:
+        """Доля неудачных запусков по задачам (сначала самые проблемные)"""
+        window, params = self._window("r.ts", since, until)
+        rows = self.conn.execute(f"""
+            SELECT t.name, COUNT(*) AS runs,
+                   SUM(r.outcome = 'error') AS failures,
+                   SUM(r.outcome = 'warning') AS warnings
+            FROM task_runs r JOIN tasks t ON t.id = r.task_id
+            WHERE r.outcome IS NOT NULL{window}
+            GROUP BY r.task_id
+            HAVING runs >= ?
+            ORDER BY CAST(failures AS REAL) / runs DESC, runs DESC
+        """, params + [min_runs]).fetchall()
+        return [TaskFailureRate(name, runs, failures, warnings, failures / runs)
+                for name, runs, failures, warnings in rows]
+
+    def command_frequency(self, since: Optional[float] = None, until: Optional[float] = None,
+                          limit: int = 20) -> List[CommandFrequency]:
+        """Самые частые команды"""
+        window, params = self._window("r.ts", since, until)
+        rows = self.conn.execute(f"""
+            SELECT c.command, COUNT(*) AS count
+            FROM command_runs r JOIN commands c ON c.id = r.command_id
+            WHERE 1 = 1{window}
+            GROUP BY r.command_id
+            ORDER BY count DESC
+            LIMIT ?
+        """, params + [limit]).fetchall()
+        return [CommandFrequency(command, count) for command, count in rows]
+
+    def latency_percentiles(self, kind: str = "task", name: Optional[str] = None,
+                            percentiles: Sequence[float] = (50, 90, 99),
+                            since: Optional[float] = None,
+                            until: Optional[float] = None) -> LatencyPercentiles:
+        """Перцентили длительности (метод ближайшего ранга)"""
+        if kind == "task":
+            runs, labels, label_column, id_column = "task_runs", "tasks", "name", "task_id"
+        elif kind == "command":
+            runs, labels, label_column, id_column = "command_runs", "commands", "command", "command_id"
+        else:
+            raise ValueError(f"Неизвестный тип: {kind}")
+
+        window, params = self._window("ts", since, until)
+        if name is not None:
+            row = self.conn.execute(f"SELECT id FROM {labels} WHERE {label_column} = ?", (name,)).fetchone()
+            if row is None:
+                return LatencyPercentiles(kind, name, 0, {})
+            window += f" AND {id_column} = ?"
+            params.append(row[0])
+
+        where = f"WHERE duration IS NOT NULL{window}"
+        count = self.conn.execute(f"SELECT COUNT(*) FROM {runs} {where}", params).fetchone()[0]
+
+        values = {}
+        if count:
+            # Один проход курсора по индексу длительностей: в памяти только значения нужных рангов
+            ranks = {}
+            for p in percentiles:
+                ranks.setdefault(min(count, max(1, math.ceil(p / 100 * count))), []).append(p)
+            rows = self.conn.execute(
+                f"SELECT duration FROM {runs} {where} ORDER BY duration LIMIT ?",
+                params + [max(ranks)])
+            for rank, (duration,) in enumerate(rows, 1):
+                for p in ranks.get(rank, ()):
+                    values[p] = duration
+            values = {p: values[p] for p in percentiles}
+
+        return LatencyPercentiles(kind, name, count, values)
+
+
+def parse_time(value: str) -> float:
+    """Разбор времени в формате ISO: '2025-08-17 21:00' или '2025-08-17T21:00:00'"""
+    return datetime.fromisoformat(value).timestamp()
+
+
+def parse_duration(value: str) -> timedelta:
+    """Разбор длительности вида 30m, 24h, 7d"""
+    match = re.fullmatch(r"(\d+)([smhd])", value)
+    if not match:
+        raise argparse.ArgumentTypeError(f"Неверная длительность: {value}")
+    unit = {"s": "seconds", "m": "minutes", "h": "hours", "d": "days"}[match.group(2)]
+    return timedelta(**{unit: int(match.group(1))})
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Точка входа командной строки"""
+    parser = argparse.ArgumentParser(description="Аналитика лога ai_core.log")
+    parser.add_argument("--log", default=DEFAULT_LOG, help="файл лога")
+    parser.add_argument("--db", default=DEFAULT_DB, help="файл индекса SQLite")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("ingest", help="догрузить новые строки лога в индекс")
+
+    query_parent = argparse.ArgumentParser(add_help=False)
+    query_parent.add_argument("--since", type=parse_time, help="начало окна (ISO)")
+    query_parent.add_argument("--until", type=parse_time, help="конец окна (ISO)")
+    query_parent.add_argument("--last", type=parse_duration, help="окно от текущего момента: 30m, 24h, 7d")
+    query_parent.add_argument("--no-ingest", action="store_true", help="не обновлять индекс перед запросом")
+
+    failures_parser = subparsers.add_parser("failures", parents=[query_parent],
+                                            help="доля неудачных запусков задач")
+    failures_parser.add_argument("--min-runs", type=int, default=1)
+
+    commands_parser = subparsers.add_parser("commands", parents=[query_parent], help="частота команд")
+    commands_parser.add_argument("--limit", type=int, default=20)
+
+    latency_parser = subparsers.add_parser("latency", parents=[query_parent],
+                                           help="перцентили длительности")
+    latency_parser.add_argument("--kind", choices=("task", "command"), default="task")
+    latency_parser.add_argument("--name", help="имя задачи или команда")
+    latency_parser.add_argument("-p", "--percentile", type=float, action="append",
+                                help="перцентиль (можно несколько раз)")
+
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.log):
+        print(f"❌ Лог не найден: {args.log}")
+        return 1
+
+    index = LogIndex(args.db, args.log)
+    try:
+        if args.command == "ingest" or not args.no_ingest:
+            processed = index.ingest()
+            if args.command == "ingest":
+                print(f"✅ Обработано строк: {processed}")
+                return 0
+
+        since = args.since
+        if args.last is not None:
+            since = (datetime.now() - args.last).timestamp()
+
+        if args.command == "failures":
+            for stats in index.task_failure_rates(since, args.until, args.min_runs):
+                print(f"{stats.failure_rate:6.1%}  {stats.failures:>5}/{stats.runs:<5} "
+                      f"⚠️ {stats.warnings:<5} {stats.name}")
+
+        elif args.command == "commands":
+            for stats in index.command_frequency(since, args.until, args.limit):
+                print(f"{stats.count:>7}  {stats.command}")
+
+        elif args.command == "latency":
+            percentiles = args.percentile or [50, 90, 99]
+            stats = index.latency_percentiles(args.kind, args.name, percentiles, since, args.until)
+            print(f"📊 {args.kind} {stats.name or '(все)'}: {stats.count} измерений")
+            for p, value in stats.percentiles.items():
+                print(f"   p{p:g}: {value:.3f} с")
+
+        return 0
+    finally:
+        index.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
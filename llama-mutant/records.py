@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Records - Компактные типы записей для задач, результатов команд и статусов
+Все записи используют __slots__ и поддерживают доступ как к словарю
+для совместимости со старым кодом
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+
+class Record:
+    """Базовая запись со __slots__ и совместимым со словарем интерфейсом"""
+
+    __slots__ = ()
+
+    # Поля, которые не попадают в to_dict(), если равны None
+    _optional_fields = ()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Преобразование записи в словарь старого формата"""
+        result = {}
+        for field in self.__slots__:
+            value = getattr(self, field)
+            if value is None and field in self._optional_fields:
+                continue
+            if isinstance(value, Record):
+                value = value.to_dict()
+            result[field] = value
+        return result
+
+    def keys(self) -> List[str]:
+        """Список полей, присутствующих в to_dict()"""
+        return [field for field in self.__slots__ if field in self]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Аналог dict.get для совместимости"""
+        if key in self:
+            return getattr(self, key)
+        return default
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key: str, value: Any):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key: object) -> bool:
+        if key not in self.__slots__:
+            return False
+        if key in self._optional_fields:
+            return getattr(self, key) is not None
+        return True
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Record):
+            return type(self) is type(other) and self.to_dict() == other.to_dict()
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{field}={getattr(self, field)!r}" for field in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+class ScheduledTask(Record):
+    """Задача планировщика автономного режима"""
+
+    __slots__ = ("name", "function", "interval", "last_run", "priority")
+
+    def __init__(self, name: str, function: Callable[[], Any], interval: float,
+                 last_run: float = 0, priority: str = "medium"):
+        self.name = name
+        self.function = function
+        self.interval = interval
+        self.last_run = last_run
+        self.priority = priority
+
+    def is_due(self, current_time: float) -> bool:
+        """Пора ли выполнять задачу"""
+        return current_time - self.last_run >= self.interval
+
+
+class CommandResult(Record):
+    """Результат выполнения системной команды"""
+
+    __slots__ = ("success", "command", "stdout", "stderr", "returncode", "error")
+    _optional_fields = ("stdout", "stderr", "returncode", "error")
+
+    def __init__(self, success: bool, command: str, stdout: Optional[str] = None,
+                 stderr: Optional[str] = None, returncode: Optional[int] = None,
+                 error: Optional[str] = None):
+        self.success = success
+        self.command = command
+        self.stdout = stdout
+        self.stderr = stderr
+        self.returncode = returncode
+        self.error = error
+
+
+class FilesystemInfo(Record):
+    """Результат исследования директории"""
+
+    __slots__ = ("current_path", "explored_path", "files", "directories",
+                 "permissions", "size_info", "error")
+    _optional_fields = ("current_path", "explored_path", "files", "directories",
+                        "permissions", "size_info", "error")
+
+    def __init__(self, current_path: Optional[str] = None, explored_path: Optional[str] = None,
+                 files: Optional[List[str]] = None, directories: Optional[List[str]] = None,
+                 permissions: Optional[Dict] = None, size_info: Optional[Dict[str, int]] = None,
+                 error: Optional[str] = None):
+        self.current_path = current_path
+        self.explored_path = explored_path
+        self.files = files
+        self.directories = directories
+        self.permissions = permissions
+        self.size_info = size_info
+        self.error = error
+
+    @classmethod
+    def failed(cls, error: str) -> "FilesystemInfo":
+        """Запись об ошибке исследования"""
+        return cls(error=error)
+
+
+class AICoreStatus(Record):
+    """Статус AI Core"""
+
+    __slots__ = ("name", "version", "mission", "self_awareness", "current_task",
+                 "goals", "network_nodes", "code_improvements", "uptime")
+
+    def __init__(self, name: str, version: str, mission: str, self_awareness: float,
+                 current_task: Optional[str], goals: Sequence[str], network_nodes: int,
+                 code_improvements: int, uptime: float):
+        self.name = name
+        self.version = version
+        self.mission = mission
+        self.self_awareness = self_awareness
+        self.current_task = current_task
+        self.goals = goals
+        self.network_nodes = network_nodes
+        self.code_improvements = code_improvements
+        self.uptime = uptime
+
+
+class AutonomousStatus(Record):
+    """Статус автономного режима"""
+
+    __slots__ = ("is_running", "active_threads", "scheduled_tasks",
+                 "last_evolution", "ai_core_status")
+
+    def __init__(self, is_running: bool, active_threads: int, scheduled_tasks: int,
+                 last_evolution: str, ai_core_status: AICoreStatus):
+        self.is_running = is_running
+        self.active_threads = active_threads
+        self.scheduled_tasks = scheduled_tasks
+        self.last_evolution = last_evolution
+        self.ai_core_status = ai_core_status
+
+
+class TaskFailureRate(Record):
+    """Статистика выполнения задачи по логу"""
+
+    __slots__ = ("name", "runs", "failures", "warnings", "failure_rate")
+
+    def __init__(self, name: str, runs: int, failures: int, warnings: int, failure_rate: float):
+        self.name = name
+        self.runs = runs
+        self.failures = failures
+        self.warnings = warnings
+        self.failure_rate = failure_rate
+
+
+class CommandFrequency(Record):
+    """Частота выполнения команды по логу"""
+
+    __slots__ = ("command", "count")
+
+    def __init__(self, command: str, count: int):
+        self.command = command
+        self.count = count
+
+
+class LatencyPercentiles(Record):
+    """Перцентили длительности задач или команд (в секундах)"""
+
+    __slots__ = ("kind", "name", "count", "percentiles")
+
+    def __init__(self, kind: str, name: Optional[str], count: int, percentiles: Dict[float, float]):
+        self.kind = kind
+        self.name = name
+        self.count = count
+        self.percentiles = percentiles
@@ -102,8 +102,56 @@ def test_ai_core():
         fs_info = ai.explore_filesystem(".")
         print_success(f"Исследование файловой системы: {len(fs_info.get('files', []))} файлов")
         
+        # Записи должны вести себя как старые словари
+        fs_dict = fs_info.to_dict()
+        assert set(fs_dict) == {"current_path", "explored_path", "files", "directories",
+                                "permissions", "size_info"}, fs_dict
+        assert fs_info["files"] is fs_info.files and "error" not in fs_info
+        assert fs_info.get("error", "нет") == "нет"
+        
+        missing = ai.explore_filesystem("/nonexistent/llama-mutant")
+        assert "error" in missing and missing["error"] == missing.error
+        assert missing.to_dict() == {"error": missing.error}
+        assert missing.get("files", []) == [] and "files" not in missing
+        try:
+            missing["files"]
+            raise AssertionError("Ожидался KeyError для отсутствующего поля")
+        except KeyError:
+            pass
+        print_success("Результаты explore_filesystem совместимы со словарями")
+        
+        # Кэш статуса и время работы по симулируемым часам
+        from clock import FakeClock
+        import tempfile
+        
+        clock = FakeClock()
+        ai = AICore(clock=clock)
+        assert ai.get_status().uptime == 0
+        clock.advance(5)
+        assert ai.get_status().uptime == 5, ai.get_status().uptime
+        
+        # Внутри status_ttl снимок тот же, но evolve() его сбрасывает
+        status = ai.get_status()
+        assert ai.get_status() is status
+        for _ in range(5):
+            ai.evolve()
+        status = ai.get_status()
+        assert status.self_awareness == ai.self_awareness_level
+        assert list(status.goals) == ai.goals and len(status.goals) == 6, status.goals
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            target = os.path.join(tmpdir, "sample.py")
+            with open(target, "w", encoding="utf-8") as f:
+                f.write("print('hi')\n")
+            assert ai.self_program(target, ["логирование"])
+        assert ai.get_status().code_improvements == 1
+        print_success("Статус AI Core кэшируется и сбрасывается при изменениях")
+        
         return True
         
+    except AssertionError as e:
+        print_error(f"Проверка AI Core не пройдена: {e}")
+        raise
     except Exception as e:
         print_error(f"Ошибка в AI Core: {e}")
         return False
@@ -121,8 +169,57 @@ def test_autonomous_ai():
         status = ai.get_status()
         print_success(f"Статус автономного режима: {status['scheduled_tasks']} задач")
         
+        from clock import FakeClock
+        from records import ScheduledTask
+        
+        ai = AutonomousAI(clock=FakeClock())
+        status = ai.get_status()
+        assert ai.get_status().scheduled_tasks == status.scheduled_tasks
+        
+        # schedule_task и evolve() видны в статусе сразу, без ожидания status_ttl
+        ai.schedule_task(ScheduledTask(name="Проверка", function=lambda: True, interval=60))
+        assert ai.get_status().scheduled_tasks == status.scheduled_tasks + 1
+        for _ in range(5):
+            ai.ai_core.evolve()
+        core_status = ai.get_status().ai_core_status
+        assert core_status.self_awareness == ai.ai_core.self_awareness_level
+        assert len(core_status.goals) == len(ai.ai_core.goals) == 6
+        
+        # Счетчик потоков возвращается к нулю после завершения
+        import threading
+        release = threading.Event()
+        thread = ai.start_background_thread(release.wait)
+        assert ai.get_status().active_threads == 1
+        release.set()
+        thread.join(timeout=5)
+        assert ai.get_status().active_threads == 0
+
+        # Замена списка задач целиком тоже сбрасывает кэш
+        ai.task_scheduler = []
+        assert ai.get_status().scheduled_tasks == 0
+        ai.initialize_tasks()
+        assert ai.get_status().scheduled_tasks == status.scheduled_tasks
+
+        # Пока stop() ждет потоки, статус уже показывает остановку
+        release.clear()
+        ai.is_running = True
+        ai.start_background_thread(release.wait)
+        assert ai.get_status().is_running
+        stopper = threading.Thread(target=ai.stop)
+        stopper.start()
+        deadline = time.perf_counter() + 2
+        while ai.get_status().is_running and time.perf_counter() < deadline:
+            time.sleep(0.001)
+        assert not ai.get_status().is_running and stopper.is_alive()
+        release.set()
+        stopper.join(timeout=5)
+        print_success("Статус автономного режима обновляется при изменениях")
+        
         return True
         
+    except AssertionError as e:
+        print_error(f"Проверка автономного режима не пройдена: {e}")
+        raise
     except Exception as e:
         print_error(f"Ошибка в автономном режиме: {e}")
         return False
@@ -195,32 +292,319 @@ def test_system_commands():
         else:
             print_error("Защита от опасных команд не работает")
         
+        # Словари старого формата: без stdout/stderr/returncode у ошибки
+        assert result.to_dict() == {
+            "success": False,
+            "error": "Команда 'rm' запрещена по соображениям безопасности",
+            "command": "rm /tmp/test"
+        }, result.to_dict()
+        assert "stdout" not in result and result.get("returncode") is None
+        
+        result = ai.execute_command("echo llama")
+        assert result.to_dict() == {
+            "success": True,
+            "command": "echo llama",
+            "stdout": "llama\n",
+            "stderr": "",
+            "returncode": 0
+        }, result.to_dict()
+        assert "error" not in result and result == result.to_dict()
+        print_success("Результаты execute_command совместимы со словарями")
+        
         return True
         
+    except AssertionError as e:
+        print_error(f"Проверка системных команд не пройдена: {e}")
+        raise
     except Exception as e:
         print_error(f"Ошибка тестирования команд: {e}")
         return False
 
-def run_integration_test():
-    """Запуск интеграционного теста"""
-    print_header("Интеграционный тест")
+def test_benchmark_compare():
+    """Тестирование сравнения бенчмарков с базовой линией"""
+    print_header("Тестирование сравнения бенчмарков")
+
+    try:
+        import io
+        import tempfile
+        import contextlib
+        from benchmark_suite import compare_results, save_results, load_results, main as bench_main
+
+        def result(min_ns, mad_ns=1.0):
+            return {"min_ns": min_ns, "median_ns": min_ns, "mad_ns": mad_ns}
+
+        baseline = {"meta": {"rounds": 10}, "benchmarks": {
+            "slower": result(100.0),
+            "faster": result(100.0),
+            "noisy": result(100.0, mad_ns=20.0),
+            "removed": result(100.0),
+            "zero": result(0.0),
+            "old_format": {"min_ns": 100.0, "median_ns": 100.0},
+        }}
+        current = {"meta": {"rounds": 10}, "benchmarks": {
+            "slower": result(150.0),
+            "faster": result(50.0),
+            "noisy": result(150.0, mad_ns=20.0),
+            "added": result(10.0),
+            "zero": result(5.0),
+            "old_format": {"min_ns": 150.0, "median_ns": 150.0},
+        }}
+
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            regressions = compare_results(baseline, current, threshold=10)
+        # Замедление в пределах шума (3 × (20 + 20) нс) не считается регрессией
+        assert regressions == ["old_format", "slower"], regressions
+        assert "removed" in output.getvalue() and "added" in output.getvalue(), output.getvalue()
+        with contextlib.redirect_stdout(io.StringIO()):
+            assert compare_results(baseline, current, threshold=60) == []
+            assert compare_results(baseline, current, threshold=10, noise_mads=0) == \
+                ["noisy", "old_format", "slower"]
+        print_success("Регрессии отличаются от ускорений, шума и изменений состава")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            baseline_path = os.path.join(tmp, "nested", "baseline.json")
+            current_path = os.path.join(tmp, "current.json")
+            save_results(baseline, baseline_path)
+            save_results(current, current_path)
+            assert load_results(baseline_path) == baseline
+
+            with contextlib.redirect_stdout(io.StringIO()):
+                assert bench_main(["compare", baseline_path, current_path]) == 1
+                assert bench_main(["compare", baseline_path, current_path, "--threshold", "60"]) == 0
+                assert bench_main(["compare", baseline_path, baseline_path]) == 0
+        print_success("Сохранение JSON и код выхода compare работают")
+
+        return True
+
+    except Exception as e:
+        print_error(f"Проверка сравнения бенчмарков не пройдена: {e}")
+        raise
+
+def test_fake_clock():
+    """Тестирование симулируемых часов"""
+    print_header("Тестирование симулируемых часов")
     
     try:
-        # Запуск автономного режима на короткое время
-        print_info("Запуск автономного режима на 10 секунд...")
-        
+        import threading
         from autonomous_ai import AutonomousAI
-        ai = AutonomousAI()
-        ai.start()
+        from clock import FakeClock
+        from records import ScheduledTask
         
-        time.sleep(10)
+        # simulate() работает только с симулируемыми часами
+        try:
+            AutonomousAI().simulate(10)
+            raise AssertionError("simulate() с SystemClock должен падать")
+        except TypeError:
+            print_success("simulate() отклоняет реальные часы")
         
-        status = ai.get_status()
-        print_success(f"Автономный режим работал: {status['active_threads']} активных потоков")
+        # Час работы планировщика по симулируемым часам
+        ai = AutonomousAI(clock=FakeClock())
+        counts = {60: 0, 300: 0, 1800: 0}
+
+        def make_task(interval):
+            def task():
+                counts[interval] += 1
+                return True
+            return task
+
+        ai.task_scheduler = [
+            ScheduledTask(name=f"Задача {interval}", function=make_task(interval), interval=interval)
+            for interval in counts
+        ]
+
+        started = time.perf_counter()
+        ai.simulate(3600, loops=("scheduler",))
+        elapsed = time.perf_counter() - started
+        assert counts == {60: 61, 300: 13, 1800: 3}, counts
+        assert elapsed < 5, elapsed
+        print_success(f"Симулированный час выполнен за {elapsed * 1000:.1f} мс: {counts}")
+        
+        # Фоновый поток ждет, пока время не сдвинут вручную
+        clock = FakeClock()
+        ai = AutonomousAI(clock=clock)
+        runs = []
+        ai.task_scheduler = [
+            ScheduledTask(name="Проверка", function=lambda: runs.append(clock.time()) or True, interval=60)
+        ]
+        ai.is_running = True
+        ai.start_background_thread(ai.scheduler_loop)
+        
+        def wait_for(count):
+            deadline = time.perf_counter() + 5
+            while len(runs) < count and time.perf_counter() < deadline:
+                time.sleep(0.001)
         
+        wait_for(1)
+        time.sleep(0.1)
+        assert len(runs) == 1, f"Планировщик крутится без сдвига времени: {len(runs)} запусков"
+        
+        clock.advance(60)
+        wait_for(2)
+        assert len(runs) == 2 and runs[1] - runs[0] == 60, runs
+        print_success(f"Поток планировщика следует за симулируемым временем: {len(runs)} запуска")
+        
+        started = time.perf_counter()
         ai.stop()
-        print_success("Автономный режим остановлен")
+        elapsed = time.perf_counter() - started
+        assert ai.get_status().active_threads == 0 and elapsed < 1, elapsed
+        print_success(f"Остановка с FakeClock заняла {elapsed * 1000:.1f} мс")
+        
+        return True
         
+    except Exception as e:
+        print_error(f"Проверка симулируемых часов не пройдена: {e}")
+        raise
+
+def test_log_analytics():
+    """Тестирование аналитики логов"""
+    print_header("Тестирование аналитики логов")
+
+    try:
+        import io
+        import shutil
+        import tempfile
+        import contextlib
+        from log_analytics import LogIndex, main as analytics_main
+
+        def line(second, message, level="INFO"):
+            return f"2025-08-18 10:{second // 60:02d}:{second % 60:02d},000 - {level} - {message}\n"
+
+        log = [
+            line(0, "📋 Выполняю задачу: Анализ"),
+            line(1, "✅ Задача 'Анализ' выполнена успешно"),
+            line(10, "📋 Выполняю задачу: Анализ"),
+            line(12, "✅ Задача 'Анализ' выполнена успешно"),
+            line(20, "📋 Выполняю задачу: Анализ"),
+            line(23, "❌ Ошибка при выполнении задачи 'Анализ': timeout", "ERROR"),
+            line(30, "📋 Выполняю задачу: Анализ"),
+            line(34, "✅ Задача 'Анализ' выполнена успешно"),
+            line(40, "📋 Выполняю задачу: Сеть"),
+            line(50, "⚠️ Задача 'Сеть' завершилась с предупреждениями", "WARNING"),
+            line(60, "📋 Выполняю задачу: Сеть"),
+            line(80, "✅ Задача 'Сеть' выполнена успешно"),
+            line(90, "Сообщение без статистики"),
+        ]
+        for second, duration in ((100, 0.1), (101, 0.2), (102, 0.3)):
+            log.append(line(second, "⚡ Выполняю команду: ls"))
+            log.append(line(second, f"⏱️ Команда завершена за {duration:.3f} с (код 0): ls"))
+        log.append(line(110, "⚡ Выполняю команду: sleep 60"))
+        log.append(line(115, "⏱️ Команда превысила лимит времени за 5.000 с: sleep 60", "WARNING"))
+
+        with tempfile.TemporaryDirectory() as tmp:
+            log_path = os.path.join(tmp, "ai_core.log")
+            with open(log_path, "w", encoding="utf-8") as f:
+                f.writelines(log)
+
+            db_path = os.path.join(tmp, "ai_core_log.db")
+            index = LogIndex(db_path, log_path)
+            try:
+                assert index.ingest() == len(log)
+
+                rates = {r.name: r for r in index.task_failure_rates()}
+                assert (rates["Анализ"].runs, rates["Анализ"].failures) == (4, 1), rates
+                assert rates["Анализ"].failure_rate == 0.25
+                assert (rates["Сеть"].runs, rates["Сеть"].warnings, rates["Сеть"].failures) == (2, 1, 0), rates
+                assert [r.name for r in index.task_failure_rates(min_runs=3)] == ["Анализ"]
+
+                commands = [(c.command, c.count) for c in index.command_frequency()]
+                assert commands == [("ls", 3), ("sleep 60", 1)], commands
+
+                # Задачи: 1, 2, 3, 4, 10, 20 с; команды: 0.1, 0.2, 0.3, 5 с
+                tasks = index.latency_percentiles("task", percentiles=(50, 99))
+                assert tasks.count == 6 and tasks.percentiles == {50: 3.0, 99: 20.0}, tasks
+                cmds = index.latency_percentiles("command", percentiles=(50, 99))
+                assert cmds.count == 4 and cmds.percentiles == {50: 0.2, 99: 5.0}, cmds
+                analysis = index.latency_percentiles("task", name="Анализ", percentiles=(50,))
+                assert analysis.percentiles == {50: 2.0}, analysis
+                assert index.latency_percentiles("task", name="Нет такой").count == 0
+                print_success("Доли неудач, частоты команд и перцентили p50/p99 верны")
+
+                # Незавершенная строка дочитывается при следующем запуске
+                with open(log_path, "a", encoding="utf-8") as f:
+                    f.write(line(200, "📋 Выполняю задачу: Сеть"))
+                    f.write(line(205, "✅ Задача 'Сеть' выполнена успешно")[:30])
+                assert index.ingest() == 1
+                with open(log_path, "a", encoding="utf-8") as f:
+                    f.write(line(205, "✅ Задача 'Сеть' выполнена успешно")[30:])
+                assert index.ingest() == 1
+                network = index.latency_percentiles("task", name="Сеть", percentiles=(0, 100))
+                assert network.count == 3 and network.percentiles == {0: 5.0, 100: 20.0}, network
+                print_success("Дописанная частями строка учтена один раз")
+
+                # Замена файла тем же содержимым не дублирует записи
+                shutil.copy(log_path, log_path + ".tmp")
+                os.replace(log_path + ".tmp", log_path)
+                assert index.ingest() == 0
+                assert index.command_frequency()[0].count == 3
+
+                # Усеченный лог читается заново с начала
+                with open(log_path, "w", encoding="utf-8") as f:
+                    f.write(line(300, "⏱️ Команда завершена за 0.400 с (код 0): ls"))
+                assert index.ingest() == 1
+                assert index.command_frequency()[0].count == 4
+                print_success("Замена и усечение лога обрабатываются корректно")
+            finally:
+                index.close()
+
+            # Командная строка поверх того же индекса
+            def cli(*args, log=log_path):
+                output = io.StringIO()
+                with contextlib.redirect_stdout(output):
+                    code = analytics_main(["--log", log, "--db", db_path] + list(args))
+                return code, output.getvalue()
+
+            assert cli("ingest") == (0, "✅ Обработано строк: 0\n")
+            assert cli("ingest", log=os.path.join(tmp, "missing.log"))[0] == 1
+
+            code, output = cli("failures", "--no-ingest", "--since", "2025-08-18 10:00:15")
+            assert code == 0 and output.splitlines()[0].startswith(" 50.0%      1/2"), output
+            assert output.splitlines()[0].endswith("Анализ"), output
+
+            code, output = cli("commands", "--no-ingest", "--until", "2025-08-18 10:01:45")
+            assert (code, output) == (0, f"{3:>7}  ls\n"), output
+            assert cli("commands", "--last", "1h") == (0, "")
+
+            with open(log_path, "a", encoding="utf-8") as f:
+                f.write(line(400, "⏱️ Команда завершена за 0.500 с (код 0): pwd"))
+            assert "pwd" not in cli("commands", "--no-ingest")[1]
+            assert f"{1:>7}  pwd\n" in cli("commands")[1]
+
+            # Команды: 0.1, 0.2, 0.3, 0.4, 0.5, 5 с
+            code, output = cli("latency", "--kind", "command", "-p", "50", "-p", "99", "--no-ingest")
+            assert code == 0 and "6 измерений" in output, output
+            assert "p50: 0.300 с" in output and "p99: 5.000 с" in output, output
+            print_success("Командная строка: ingest, --since, --until, --last, --no-ingest")
+
+        return True
+
+    except Exception as e:
+        print_error(f"Проверка аналитики логов не пройдена: {e}")
+        raise
+
+def run_integration_test():
+    """Запуск интеграционного теста"""
+    print_header("Интеграционный тест")
+    
+    try:
+        from autonomous_ai import AutonomousAI
+
+        # Остановка не должна ждать окончания паузы цикла
+        ai = AutonomousAI()
+        ai.task_scheduler = []
+        ai.is_running = True
+        ai.start_background_thread(ai.scheduler_loop)
+        time.sleep(0.1)
+
+        started = time.perf_counter()
+        ai.stop()
+        elapsed = time.perf_counter() - started
+
+        if ai.get_status()['active_threads'] != 0 or elapsed > 1:
+            print_error(f"Остановка заняла {elapsed:.2f} с")
+            return False
+        print_success(f"Автономный режим остановлен за {elapsed * 1000:.1f} мс")
+
         return True
         
     except Exception as e:
@@ -239,6 +623,9 @@ def main():
         ("Интеграция с Llama", test_llama_integration),
         ("Права доступа", test_file_permissions),
         ("Системные команды", test_system_commands),
+        ("Сравнение бенчмарков", test_benchmark_compare),
+        ("Симулируемые часы", test_fake_clock),
+        ("Аналитика логов", test_log_analytics),
         ("Интеграционный тест", run_integration_test)
     ]
     